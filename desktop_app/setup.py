@@ -0,0 +1,13 @@
+"""Builds the optional _crc8ext CRC-8 accelerator in place:
+
+    python setup.py build_ext --inplace
+
+The app runs without it; protocol.py falls back to pure Python.
+"""
+from setuptools import Extension, setup
+
+setup(
+    name="ffb-companion-ext",
+    package_dir={"": "src"},
+    ext_modules=[Extension("_crc8ext", ["src/_crc8ext.c"], optional=True)],
+)
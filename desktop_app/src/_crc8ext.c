@@ -0,0 +1,58 @@
+/*
+ * Optional C accelerator for protocol._crc8 — CRC-8 (polynomial 0x07).
+ *
+ * Mirrors crc8() in firmware/include/protocol.h. protocol.py falls back to
+ * its pure-Python table lookup when this module is not built.
+ *
+ * Build in place, from desktop_app/ (any platform with a C compiler):
+ *   python setup.py build_ext --inplace
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+
+static uint8_t crc8_table[256];
+
+static void crc8_init_table(void) {
+    for (int i = 0; i < 256; i++) {
+        uint8_t crc = (uint8_t)i;
+        for (int j = 0; j < 8; j++) {
+            crc = (crc & 0x80) ? (uint8_t)((crc << 1) ^ 0x07) : (uint8_t)(crc << 1);
+        }
+        crc8_table[i] = crc;
+    }
+}
+
+static uint8_t crc8(const uint8_t *data, size_t len) {
+    uint8_t crc = 0x00;
+    for (size_t i = 0; i < len; i++) {
+        crc = crc8_table[crc ^ data[i]];
+    }
+    return crc;
+}
+
+static PyObject *py_crc8(PyObject *Py_UNUSED(self), PyObject *arg) {
+    Py_buffer buf;
+    uint8_t crc;
+
+    if (PyObject_GetBuffer(arg, &buf, PyBUF_SIMPLE) < 0) {
+        return NULL;
+    }
+    crc = crc8((const uint8_t *)buf.buf, (size_t)buf.len);
+    PyBuffer_Release(&buf);
+    return PyLong_FromLong(crc);
+}
+
+static PyMethodDef crc8ext_methods[] = {
+    {"crc8", py_crc8, METH_O, "crc8(data) -> int\n\nCRC-8 (poly 0x07) of a bytes-like object."},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef crc8ext_module = {
+    PyModuleDef_HEAD_INIT, "_crc8ext", NULL, -1, crc8ext_methods, NULL, NULL, NULL, NULL,
+};
+
+PyMODINIT_FUNC PyInit__crc8ext(void) {
+    crc8_init_table();
+    return PyModule_Create(&crc8ext_module);
+}
@@ -5,13 +5,13 @@ from PySide6.QtCore import QThread, Signal
 
 
 class ControllerInput(QThread):
-    steering_changed = Signal(float)       # -1.0 to 1.0
+    steering_changed = Signal(float, float)  # -1.0 to 1.0, event time (time.monotonic() s)
     throttle_changed = Signal(float)       # 0.0 to 1.0
     brake_changed = Signal(float)          # 0.0 to 1.0
     controller_status = Signal(str)        # Status text for UI
 
     DEADZONE = 0.05
-    POLL_RATE_HZ = 100
+    EVENT_TIMEOUT_MS = 100  # Max wait per event so stop() stays responsive
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -28,55 +28,93 @@ class ControllerInput(QThread):
         sign = 1.0 if value > 0 else -1.0
         return sign * (abs(value) - dz) / (1.0 - dz)
 
+    def _open_joystick(self):
+        """Open the first connected controller, or return None if there is none."""
+        if pygame.joystick.get_count() == 0:
+            return None
+        joystick = pygame.joystick.Joystick(0)
+        joystick.init()
+        self.controller_status.emit(f"Controller: {joystick.get_name()}")
+        return joystick
+
     def run(self):
         self._running = True
         pygame.init()
         pygame.joystick.init()
 
-        joystick = None
+        # Only wake up for controller events
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(
+            [pygame.JOYAXISMOTION, pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED]
+        )
+
+        joystick = self._open_joystick()
+        if joystick is None:
+            self.controller_status.emit("No controller")
         last_steering = 0.0
+        last_throttle = -1.0
+        last_brake = -1.0
 
         while self._running:
-            # --- Detect controller ---
-            if joystick is None:
-                pygame.joystick.quit()
-                pygame.joystick.init()
-                if pygame.joystick.get_count() > 0:
-                    joystick = pygame.joystick.Joystick(0)
-                    joystick.init()
-                    name = joystick.get_name()
-                    self.controller_status.emit(f"Controller: {name}")
-                else:
-                    self.controller_status.emit("No controller")
-                    time.sleep(1.0)
-                    continue
-
             try:
-                pygame.event.pump()
-
-                # Left stick X axis → steering
-                raw_x = joystick.get_axis(0)
-                steering = self._apply_deadzone(raw_x, self.DEADZONE)
-                if abs(steering - last_steering) > 0.001:
-                    last_steering = steering
-                    self.steering_changed.emit(steering)
-
-                # Triggers → throttle/brake (axis 4 = right trigger, axis 5 = left trigger on Xbox)
-                # Triggers are typically -1 (released) to 1 (pressed)
-                num_axes = joystick.get_numaxes()
-                if num_axes > 5:
-                    rt = (joystick.get_axis(5) + 1.0) / 2.0  # 0..1
-                    lt = (joystick.get_axis(4) + 1.0) / 2.0
-                    self.throttle_changed.emit(max(0.0, min(1.0, rt)))
-                    self.brake_changed.emit(max(0.0, min(1.0, lt)))
-
+                # Block until the OS delivers an event, then drain the rest of the queue
+                event = pygame.event.wait(self.EVENT_TIMEOUT_MS)
+                if event.type == pygame.NOEVENT:
+                    continue
+                # wait() already pumped SDL; skip a second pump while draining
+                events = [event] + pygame.event.get(pump=False)
+                # Stamp on this thread so GUI-side signal delivery jitter stays out of the plot
+                t = time.monotonic()
             except pygame.error:
                 joystick = None
                 self.controller_status.emit("Controller lost")
                 time.sleep(0.5)
                 continue
 
-            time.sleep(1.0 / self.POLL_RATE_HZ)
+            axes: dict[int, float] = {}  # Newest raw value per axis in this batch
+            instance_id = joystick.get_instance_id() if joystick is not None else None
+            for event in events:
+                if event.type == pygame.JOYDEVICEADDED:
+                    if joystick is None:
+                        joystick = self._open_joystick()
+                        instance_id = joystick.get_instance_id() if joystick is not None else None
+                        axes.clear()
+
+                elif event.type == pygame.JOYDEVICEREMOVED:
+                    if event.instance_id == instance_id:
+                        joystick = self._open_joystick()
+                        instance_id = joystick.get_instance_id() if joystick is not None else None
+                        axes.clear()
+                        if joystick is None:
+                            self.controller_status.emit("Controller lost")
+
+                elif event.type == pygame.JOYAXISMOTION:
+                    if event.instance_id == instance_id:
+                        axes[event.axis] = event.value
+
+            if not axes:
+                continue
+
+            # Left stick X axis → steering
+            if 0 in axes:
+                steering = self._apply_deadzone(axes[0], self.DEADZONE)
+                if abs(steering - last_steering) > 0.001:
+                    last_steering = steering
+                    self.steering_changed.emit(steering, t)
+
+            # Triggers → throttle/brake (axis 4 = right trigger, axis 5 = left trigger on Xbox)
+            # Triggers are typically -1 (released) to 1 (pressed)
+            if joystick.get_numaxes() > 5:
+                if 5 in axes:
+                    rt = max(0.0, min(1.0, (axes[5] + 1.0) / 2.0))  # 0..1
+                    if abs(rt - last_throttle) > 0.005:
+                        last_throttle = rt
+                        self.throttle_changed.emit(rt)
+                if 4 in axes:
+                    lt = max(0.0, min(1.0, (axes[4] + 1.0) / 2.0))
+                    if abs(lt - last_brake) > 0.005:
+                        last_brake = lt
+                        self.brake_changed.emit(lt)
 
         pygame.joystick.quit()
         pygame.quit()
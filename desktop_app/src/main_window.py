@@ -23,6 +23,8 @@ class MainWindow(QMainWindow):
         # --- Backend threads ---
         self.serial = SerialComm()
         self.controller = ControllerInput()
+        self._last_sent_steering: int | None = None
+        self._last_loop_rate: int | None = None
 
         # --- Tabs ---
         self.tabs = QTabWidget()
@@ -75,15 +77,21 @@ class MainWindow(QMainWindow):
         self.status_connection.setStyleSheet("color: red;")
         self.status_port.setText("")
         self.status_loop_rate.setText("")
+        self._last_loop_rate = None
 
-    def _on_telemetry(self, angle: int, loop_rate: int):
-        self.status_loop_rate.setText(f"Loop: {loop_rate} Hz")
+    def _on_telemetry(self, angle: int, loop_rate: int, t: float):
+        if loop_rate != self._last_loop_rate:
+            self._last_loop_rate = loop_rate
+            self.status_loop_rate.setText(f"Loop: {loop_rate} Hz")
 
-    def _on_steering(self, position: float):
+    def _on_steering(self, position: float, t: float):
         """Controller stick moved — send steering command to ESP32 and live monitor."""
         pos_int = int(position * 32767)
+        if pos_int == self._last_sent_steering:
+            return  # Same value at firmware resolution — nothing to send
+        self._last_sent_steering = pos_int
         self.serial.send_steering(pos_int)
-        self.live_monitor.set_commanded(pos_int)
+        self.live_monitor.set_commanded(pos_int, t)
 
     def _on_controller_status(self, status: str):
         self.status_controller.setText(status)
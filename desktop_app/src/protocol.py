@@ -28,35 +28,56 @@ FAULT_NAMES = {
     FAULT_ADC_ERROR: "ADC Error",
 }
 
+# Precompiled payload formats
+_U8 = struct.Struct("B")
+_TELEMETRY = struct.Struct("<hHI")        # angle, loop_rate, sample_time_us
+_TELEMETRY_LEGACY = struct.Struct("<hH")  # firmware without the sample timestamp
+
+
+def _crc8_bitwise(byte: int) -> int:
+    crc = byte
+    for _ in range(8):
+        crc = ((crc << 1) ^ 0x07) if (crc & 0x80) else (crc << 1)
+        crc &= 0xFF
+    return crc
+
+
+# CRC-8 (polynomial 0x07) lookup table, one entry per input byte
+_CRC8_TABLE = bytes(_crc8_bitwise(i) for i in range(256))
+
 
 def _crc8(data: bytes) -> int:
     crc = 0x00
     for byte in data:
-        crc ^= byte
-        for _ in range(8):
-            crc = ((crc << 1) ^ 0x07) if (crc & 0x80) else (crc << 1)
-            crc &= 0xFF
+        crc = _CRC8_TABLE[crc ^ byte]
     return crc
 
 
+# Use the C accelerator when it has been built (see _crc8ext.c)
+try:
+    from _crc8ext import crc8 as _crc8
+except ImportError:
+    pass
+
+
 def encode_packet(cmd: int, payload: bytes = b"") -> bytes:
-    pkt = bytes([cmd, len(payload)]) + payload
-    return HEADER + pkt + bytes([_crc8(pkt)])
+    pkt = bytes((cmd, len(payload))) + payload
+    return b"".join((HEADER, pkt, bytes((_crc8(pkt),))))
 
 
-def decode_packet(buf: bytearray) -> tuple[dict | None, int]:
-    """Try to decode one packet from buffer.
+def decode_packet(buf: bytearray, start: int = 0) -> tuple[dict | None, int]:
+    """Try to decode one packet from buffer, scanning from offset `start`.
 
-    Returns (packet_dict, bytes_consumed).
+    Returns (packet_dict, bytes_consumed), bytes_consumed counted from `start`.
     packet_dict is None if no complete valid packet found.
     """
-    while len(buf) >= 5:  # minimum packet: header(2) + cmd(1) + len(1) + crc(1)
+    while len(buf) - start >= 5:  # minimum packet: header(2) + cmd(1) + len(1) + crc(1)
         # Find header
-        idx = buf.find(HEADER)
+        idx = buf.find(HEADER, start)
         if idx < 0:
-            return None, max(len(buf) - 1, 0)
-        if idx > 0:
-            return None, idx  # skip garbage bytes before header
+            return None, max(len(buf) - start - 1, 0)
+        if idx > start:
+            return None, idx - start  # skip garbage bytes before header
 
         if len(buf) < idx + 4:
             return None, 0  # need more data
@@ -68,30 +89,41 @@ def decode_packet(buf: bytearray) -> tuple[dict | None, int]:
         if len(buf) < idx + total:
             return None, 0  # need more data
 
-        pkt_data = buf[idx + 2 : idx + 4 + plen]  # cmd + len + payload
-        expected_crc = _crc8(pkt_data)
-        actual_crc = buf[idx + 4 + plen]
+        # Zero-copy views; released on exit so the caller can still resize buf
+        with memoryview(buf) as mv:
+            expected_crc = _crc8(mv[idx + 2 : idx + 4 + plen])  # cmd + len + payload
+            actual_crc = buf[idx + 4 + plen]
 
-        if expected_crc != actual_crc:
-            return None, idx + 2  # bad crc, skip past this header
+            if expected_crc != actual_crc:
+                return None, 2  # bad crc, skip past this header
 
-        payload = bytes(buf[idx + 4 : idx + 4 + plen])
-        return {"cmd": cmd, "payload": payload}, idx + total
+            payload = bytes(mv[idx + 4 : idx + 4 + plen])
+        return {"cmd": cmd, "payload": payload}, total
 
     return None, 0
 
 
+# Steering is nearly all TX traffic, so its fixed 7-byte frame is packed in one
+# call: prefix (header + cmd + len), int16 position, CRC continued from the prefix
+_STEERING_PREFIX = HEADER + bytes((CMD_SET_STEERING, 2))
+_STEERING_FRAME = struct.Struct("<4shB")
+_STEERING_CRC_SEED = _CRC8_TABLE[_CRC8_TABLE[CMD_SET_STEERING] ^ 2]
+
+
 # Convenience encoders
 def set_steering(position: int) -> bytes:
     """position: -32768 to 32767"""
-    return encode_packet(CMD_SET_STEERING, struct.pack("<h", max(-32768, min(32767, position))))
+    position = max(-32768, min(32767, position))
+    crc = _CRC8_TABLE[_STEERING_CRC_SEED ^ (position & 0xFF)]
+    crc = _CRC8_TABLE[crc ^ ((position >> 8) & 0xFF)]
+    return _STEERING_FRAME.pack(_STEERING_PREFIX, position, crc)
 
 def set_gain(gain: int) -> bytes:
     """gain: 0-100"""
-    return encode_packet(CMD_SET_GAIN, struct.pack("B", max(0, min(100, gain))))
+    return encode_packet(CMD_SET_GAIN, _U8.pack(max(0, min(100, gain))))
 
 def set_enable(enable: bool) -> bytes:
-    return encode_packet(CMD_SET_ENABLE, struct.pack("B", 1 if enable else 0))
+    return encode_packet(CMD_SET_ENABLE, _U8.pack(1 if enable else 0))
 
 def heartbeat() -> bytes:
     return encode_packet(CMD_HEARTBEAT)
@@ -99,8 +131,13 @@ def heartbeat() -> bytes:
 
 # Convenience decoders
 def parse_telemetry(payload: bytes) -> dict:
-    angle, loop_rate = struct.unpack("<hH", payload[:4])
-    return {"angle": angle, "loop_rate": loop_rate}
+    """t_us is the ESP32 micros() at sampling time, or None from older firmware."""
+    if len(payload) >= _TELEMETRY.size:
+        angle, loop_rate, t_us = _TELEMETRY.unpack_from(payload)
+    else:
+        angle, loop_rate = _TELEMETRY_LEGACY.unpack_from(payload)
+        t_us = None
+    return {"angle": angle, "loop_rate": loop_rate, "t_us": t_us}
 
 def parse_fault(payload: bytes) -> dict:
     code = payload[0]
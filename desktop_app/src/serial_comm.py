@@ -1,48 +1,168 @@
 """Serial communication thread — auto-detect ESP32, send/receive packets."""
+import collections
+import os
+import select
+import threading
 import time
 import serial
 import serial.tools.list_ports
-from PySide6.QtCore import QThread, Signal, QMutex, QMutexLocker
+from PySide6.QtCore import QThread, Signal
 
 from protocol import (
     decode_packet, set_steering, set_gain, set_enable, heartbeat,
     parse_telemetry, parse_fault,
-    CMD_TELEMETRY, CMD_FAULT, CMD_HEARTBEAT,
+    CMD_SET_STEERING, CMD_TELEMETRY, CMD_FAULT, CMD_HEARTBEAT,
 )
 
 # ESP32-S3 USB VID/PID
 ESP32_VID = 0x303A
 ESP32_PID = 0x1001
 
+HEARTBEAT_INTERVAL_S = 0.5
+IDLE_WAIT_S = 0.1  # Longest idle wait (also the port read timeout), keeps stop() responsive
+
+# Compact the RX buffer once this many parsed bytes sit in front of the read offset
+RX_COMPACT_THRESHOLD = 4096
+
+# Re-sync the ESP32 clock mapping if a sample lands this far behind host time (s)
+CLOCK_RESYNC_S = 0.25
+
 
 class SerialComm(QThread):
     connected = Signal(str)       # port name
     disconnected = Signal()
-    telemetry_received = Signal(int, int)   # angle, loop_rate
+    telemetry_received = Signal(int, int, float)  # angle, loop_rate, sample time (time.monotonic() s)
     fault_received = Signal(int, str)       # code, name
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._running = False
         self._port: serial.Serial | None = None
-        self._mutex = QMutex()
-        self._tx_queue: list[bytes] = []
+        # deque append/popleft are atomic, so producers on other threads need no lock
+        self._tx_queue: collections.deque[bytes] = collections.deque()
+        self._reset_clock_sync()
+
+        # Producers wake the serial thread out of its idle wait. On POSIX the wait
+        # is a select() on the port plus a self-pipe; Windows can't select() on
+        # serial handles, so it blocks in read() and producers cancel that read.
+        # The pipe only exists while run() is active.
+        self._use_select = os.name == "posix"
+        self._wake_r: int | None = None
+        self._wake_w: int | None = None
+        self._wake_lock = threading.Lock()  # Keeps _wake() off a pipe being closed
 
     def stop(self):
         self._running = False
         self.wait(2000)
 
     def send_steering(self, position: int):
-        with QMutexLocker(self._mutex):
-            self._tx_queue.append(set_steering(position))
+        self._tx_queue.append(set_steering(position))
+        self._wake()
 
     def send_gain(self, gain: int):
-        with QMutexLocker(self._mutex):
-            self._tx_queue.append(set_gain(gain))
+        self._tx_queue.append(set_gain(gain))
+        self._wake()
 
     def send_enable(self, enable: bool):
-        with QMutexLocker(self._mutex):
-            self._tx_queue.append(set_enable(enable))
+        self._tx_queue.append(set_enable(enable))
+        self._wake()
+
+    def _open_wake_pipe(self):
+        r, w = os.pipe()
+        os.set_blocking(r, False)
+        os.set_blocking(w, False)
+        with self._wake_lock:
+            self._wake_r, self._wake_w = r, w
+
+    def _close_wake_pipe(self):
+        with self._wake_lock:
+            r, w = self._wake_r, self._wake_w
+            self._wake_r = self._wake_w = None
+        if r is not None:
+            os.close(r)
+            os.close(w)
+
+    def _wake(self):
+        if not self._use_select:
+            port = self._port
+            if port is not None and port.is_open:
+                try:
+                    port.cancel_read()
+                except (serial.SerialException, OSError):
+                    pass  # Port went away; the serial thread handles the disconnect
+            return
+        with self._wake_lock:
+            if self._wake_w is None:
+                return  # Thread not running; the queue is drained on the next run()
+            try:
+                os.write(self._wake_w, b"\x00")
+            except BlockingIOError:
+                pass  # Pipe is full of pending wakeups already
+
+    def _wait_for_io(self, timeout: float) -> bytes:
+        """Block until RX data arrives, a packet is queued, or timeout expires.
+
+        Returns any bytes read while waiting.
+        """
+        if not self._use_select:
+            # Windows: block in read() for up to the port timeout (IDLE_WAIT_S);
+            # _wake() cancels it when a packet is queued
+            if self._tx_queue:
+                return b""
+            return self._port.read(max(1, self._port.in_waiting))
+        readable, _, _ = select.select([self._port.fileno(), self._wake_r], [], [], timeout)
+        if self._wake_r in readable:
+            try:
+                os.read(self._wake_r, 4096)
+            except BlockingIOError:
+                pass
+        return b""
+
+    def _drain_tx_queue(self) -> bytes:
+        """Pop all queued packets and join them into a single write.
+
+        Steering is latest-value, so only the newest queued steering packet is kept.
+        """
+        pkts = []
+        while True:
+            try:
+                pkts.append(self._tx_queue.popleft())
+            except IndexError:
+                break
+        if not pkts:
+            return b""
+
+        last_steering = -1
+        for i, pkt in enumerate(pkts):
+            if pkt[2] == CMD_SET_STEERING:
+                last_steering = i
+        return b"".join(
+            pkt for i, pkt in enumerate(pkts)
+            if pkt[2] != CMD_SET_STEERING or i == last_steering
+        )
+
+    def _reset_clock_sync(self):
+        self._last_t_us: int | None = None
+        self._device_s = 0.0                     # Unwrapped ESP32 micros(), in seconds
+        self._clock_offset: float | None = None  # host - device, in seconds
+
+    def _sample_time(self, t_us: int | None) -> float:
+        """Map an ESP32 micros() timestamp onto the host time.monotonic() clock."""
+        now = time.monotonic()
+        if t_us is None:
+            return now  # Older firmware: fall back to receive time
+
+        if self._last_t_us is not None:
+            self._device_s += ((t_us - self._last_t_us) & 0xFFFFFFFF) * 1e-6  # micros() wraps at 2^32
+        self._last_t_us = t_us
+
+        # Track the lowest-latency offset; re-sync after a device reset or clock drift
+        if self._clock_offset is not None:
+            t = self._device_s + self._clock_offset
+            if t <= now and now - t < CLOCK_RESYNC_S:
+                return t
+        self._clock_offset = now - self._device_s
+        return now
 
     def _find_esp32(self) -> str | None:
         for port in serial.tools.list_ports.comports():
@@ -55,7 +175,8 @@ class SerialComm(QThread):
         if not port_name:
             return False
         try:
-            self._port = serial.Serial(port_name, 115200, timeout=0.05)
+            self._port = serial.Serial(port_name, 115200, timeout=IDLE_WAIT_S)
+            self._reset_clock_sync()
             self.connected.emit(port_name)
             return True
         except serial.SerialException:
@@ -73,7 +194,16 @@ class SerialComm(QThread):
 
     def run(self):
         self._running = True
+        if self._use_select:
+            self._open_wake_pipe()
+        try:
+            self._run_loop()
+        finally:
+            self._close_wake_pipe()
+
+    def _run_loop(self):
         rx_buf = bytearray()
+        rx_pos = 0  # parse offset into rx_buf
         last_heartbeat = 0.0
 
         while self._running:
@@ -84,33 +214,47 @@ class SerialComm(QThread):
                     continue
 
             try:
-                # --- TX: send queued packets ---
-                with QMutexLocker(self._mutex):
-                    to_send = list(self._tx_queue)
-                    self._tx_queue.clear()
-                for pkt in to_send:
-                    self._port.write(pkt)
+                # --- Wait: until RX data, a queued packet, or the next heartbeat ---
+                rx_data = b""
+                if not self._tx_queue:
+                    due = last_heartbeat + HEARTBEAT_INTERVAL_S - time.monotonic()
+                    rx_data = self._wait_for_io(max(0.0, min(IDLE_WAIT_S, due)))
+
+                # --- TX: send queued packets in one write ---
+                tx_data = self._drain_tx_queue()
+                if tx_data:
+                    self._port.write(tx_data)
 
                 # --- Heartbeat ---
                 now = time.monotonic()
-                if now - last_heartbeat > 0.5:
+                if now - last_heartbeat >= HEARTBEAT_INTERVAL_S:
                     self._port.write(heartbeat())
                     last_heartbeat = now
 
-                # --- RX: read and parse ---
-                data = self._port.read(256)
-                if data:
-                    rx_buf.extend(data)
+                # --- RX: drain everything waiting, then parse ---
+                if rx_data:
+                    rx_buf.extend(rx_data)
+                n = self._port.in_waiting
+                if n:
+                    rx_buf.extend(self._port.read(n))
 
                 while True:
-                    pkt, consumed = decode_packet(rx_buf)
-                    if consumed > 0:
-                        rx_buf = rx_buf[consumed:]
-                    if pkt is None:
-                        break
-                    self._handle_packet(pkt)
-
-            except serial.SerialException:
+                    pkt, consumed = decode_packet(rx_buf, rx_pos)
+                    rx_pos += consumed
+                    if pkt is not None:
+                        self._handle_packet(pkt)
+                    elif consumed == 0:
+                        break  # need more data
+
+                # Drop parsed bytes in place rather than re-slicing per packet
+                if rx_pos >= len(rx_buf):
+                    rx_buf.clear()
+                    rx_pos = 0
+                elif rx_pos > RX_COMPACT_THRESHOLD:
+                    del rx_buf[:rx_pos]
+                    rx_pos = 0
+
+            except (serial.SerialException, OSError):
                 self._disconnect()
                 time.sleep(0.5)
 
@@ -120,7 +264,7 @@ class SerialComm(QThread):
 
         if cmd == CMD_TELEMETRY and len(payload) >= 4:
             t = parse_telemetry(payload)
-            self.telemetry_received.emit(t["angle"], t["loop_rate"])
+            self.telemetry_received.emit(t["angle"], t["loop_rate"], self._sample_time(t["t_us"]))
         elif cmd == CMD_FAULT and len(payload) >= 1:
             f = parse_fault(payload)
             self.fault_received.emit(f["code"], f["name"])
@@ -1,13 +1,50 @@
 """Real-time telemetry graphs — servo position, commanded position."""
-import collections
+import threading
 import time
 
+import numpy as np
 import pyqtgraph as pg
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import Qt, QTimer
 
 
 HISTORY_LEN = 500  # ~10 seconds at 50Hz
+PLOT_INTERVAL_MS = 33         # ~30fps while visible
+PLOT_INTERVAL_HIDDEN_MS = 60  # Background rate when the tab is not shown
+
+
+class _History:
+    """Fixed-size (time, value) ring buffer backed by preallocated numpy arrays.
+
+    Each sample is written twice, at idx and idx + size, so the last `count`
+    samples are always one contiguous, time-ordered slice. append() may run on
+    the serial thread while snapshot() runs on the GUI thread, so both hold a
+    lock, and snapshot() returns copies — pyqtgraph keeps the arrays given to
+    setData, and must not see later writes.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._t = np.empty(2 * size, dtype=np.float64)
+        self._v = np.empty(2 * size, dtype=np.float64)
+        self._idx = 0
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def append(self, t: float, value: float):
+        with self._lock:
+            i = self._idx
+            self._t[i] = self._t[i + self._size] = t
+            self._v[i] = self._v[i + self._size] = value
+            self._idx = (i + 1) % self._size
+            if self.count < self._size:
+                self.count += 1
+
+    def snapshot(self) -> tuple[np.ndarray, np.ndarray]:
+        with self._lock:
+            end = self._idx + self._size
+            start = end - self.count
+            return self._t[start:end].copy(), self._v[start:end].copy()
 
 
 class LiveMonitor(QWidget):
@@ -16,22 +53,26 @@ class LiveMonitor(QWidget):
         self._serial = serial_comm
 
         # Separate time+data buffers for each source
-        self._cmd_times = collections.deque(maxlen=HISTORY_LEN)
-        self._commanded = collections.deque(maxlen=HISTORY_LEN)
-        self._servo_times = collections.deque(maxlen=HISTORY_LEN)
-        self._servo_angles = collections.deque(maxlen=HISTORY_LEN)
+        self._commanded = _History(HISTORY_LEN)
+        self._servo_angles = _History(HISTORY_LEN)
         self._start_time = time.monotonic()
         self._last_commanded = 0
+        self._last_angle: int | None = None
+        self._last_loop_rate: int | None = None
+        self._shown_angle: int | None = None      # Values currently in the labels
+        self._shown_loop_rate: int | None = None
+        self._dirty = False  # New samples since the last plot refresh
 
         self._setup_ui()
 
-        # Connect telemetry signal
-        self._serial.telemetry_received.connect(self._on_telemetry)
+        # Telemetry is buffered directly on the serial thread; labels and plot
+        # are refreshed from the GUI timer instead of per packet
+        self._serial.telemetry_received.connect(self._on_telemetry_data, Qt.DirectConnection)
 
         # Refresh plot at 30fps
         self._timer = QTimer()
         self._timer.timeout.connect(self._update_plot)
-        self._timer.start(33)
+        self._timer.start(PLOT_INTERVAL_MS)
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -63,27 +104,52 @@ class LiveMonitor(QWidget):
 
         layout.addWidget(self._plot_widget)
 
-    def set_commanded(self, position: int):
-        """Called externally when controller input changes."""
+    def set_commanded(self, position: int, t: float | None = None):
+        """Called externally when controller input changes.
+
+        t is the time.monotonic() of the input event; defaults to now.
+        """
         self._last_commanded = position
         self._lbl_commanded.setText(f"Commanded: {position}")
         # Always record commanded position so the graph works without ESP32
-        t = time.monotonic() - self._start_time
-        self._cmd_times.append(t)
-        self._commanded.append(position)
-
-    def _on_telemetry(self, angle: int, loop_rate: int):
-        t = time.monotonic() - self._start_time
+        if t is None:
+            t = time.monotonic()
+        t -= self._start_time
+        self._commanded.append(t, position)
+        self._dirty = True
+
+    def _on_telemetry_data(self, angle: int, loop_rate: int, t: float):
+        """Runs on the serial thread — only buffers data, never touches widgets."""
+        t -= self._start_time
         # Scale ADC 0-4095 to roughly match commanded range for visual comparison
         scaled_angle = int((angle / 4095.0) * 65535 - 32768)
-        self._servo_times.append(t)
-        self._servo_angles.append(scaled_angle)
+        self._servo_angles.append(t, scaled_angle)
+        self._last_angle = angle
+        self._last_loop_rate = loop_rate
+        self._dirty = True
+
+    def showEvent(self, event):
+        self._timer.setInterval(PLOT_INTERVAL_MS)
+        super().showEvent(event)
 
-        self._lbl_angle.setText(f"Servo Angle: {angle}")
-        self._lbl_rate.setText(f"Loop Rate: {loop_rate} Hz")
+    def hideEvent(self, event):
+        self._timer.setInterval(PLOT_INTERVAL_HIDDEN_MS)
+        super().hideEvent(event)
 
     def _update_plot(self):
-        if len(self._cmd_times) >= 2:
-            self._curve_commanded.setData(list(self._cmd_times), list(self._commanded))
-        if len(self._servo_times) >= 2:
-            self._curve_servo.setData(list(self._servo_times), list(self._servo_angles))
+        if not self._dirty:
+            return  # Nothing new — skip redundant setData/repaint
+        self._dirty = False
+
+        angle, loop_rate = self._last_angle, self._last_loop_rate
+        if angle is not None and angle != self._shown_angle:
+            self._shown_angle = angle
+            self._lbl_angle.setText(f"Servo Angle: {angle}")
+        if loop_rate is not None and loop_rate != self._shown_loop_rate:
+            self._shown_loop_rate = loop_rate
+            self._lbl_rate.setText(f"Loop Rate: {loop_rate} Hz")
+
+        if self._commanded.count >= 2:
+            self._curve_commanded.setData(*self._commanded.snapshot())
+        if self._servo_angles.count >= 2:
+            self._curve_servo.setData(*self._servo_angles.snapshot())
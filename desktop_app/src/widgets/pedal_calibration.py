@@ -1,13 +1,16 @@
 """Pedal calibration — per-pedal response curve editor with shared graph."""
+import functools
+
 import numpy as np
 import pyqtgraph as pg
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
     QPushButton, QComboBox, QSlider, QGridLayout,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 CURVE_TYPES = ["Linear", "Gamma", "S-Curve"]
+REDRAW_INTERVAL_MS = 16  # ~60Hz
 
 PEDALS = [
     {"name": "Brake",    "color": "red",   "default_curve": "Gamma",   "default_sens": 22},
@@ -16,15 +19,57 @@ PEDALS = [
 ]
 
 
-def _compute_curve(x: np.ndarray, curve_type: str, sensitivity: float) -> np.ndarray:
-    if curve_type == "Linear":
-        return x.copy()
-    elif curve_type == "Gamma":
-        return np.power(x, sensitivity)
+# Shared, read-only x axes for the response curves and the linear reference.
+# The curves are smooth and monotone, so 64 points is plenty at widget size.
+_X = np.linspace(0, 1, 64).astype(np.float32)
+_X.flags.writeable = False
+_X_REF = np.array([0.0, 1.0], dtype=np.float32)  # Straight line, endpoints only
+_X_REF.flags.writeable = False
+
+
+# Precomputed terms so curves need no pow() and no extra temporaries
+_LOG_X = np.log(np.maximum(_X, 1e-12))
+_LOG_X.flags.writeable = False
+_XC = _X - np.float32(0.5)
+_XC.flags.writeable = False
+
+
+def _gamma(sensitivity: float) -> np.ndarray:
+    # x ** gamma == exp(gamma * log(x))
+    y = np.multiply(_LOG_X, sensitivity)
+    np.exp(y, out=y)
+    return y
+
+
+def _s_curve(sensitivity: float) -> np.ndarray:
+    # Logistic 1 / (1 + exp(-s * (x - 0.5))), normalised to 0..1
+    y = np.multiply(_XC, -sensitivity)
+    np.exp(y, out=y)
+    y += 1.0
+    np.reciprocal(y, out=y)
+    y -= y[0]
+    y /= y[-1]
+    return y
+
+
+def _compute_curve(curve_type: str, sensitivity: float) -> np.ndarray:
+    """Curve over _X as a single freshly allocated array."""
+    if curve_type == "Gamma":
+        return _gamma(sensitivity)
     elif curve_type == "S-Curve":
-        raw = 1.0 / (1.0 + np.exp(-sensitivity * (x - 0.5)))
-        return (raw - raw[0]) / (raw[-1] - raw[0])
-    return x.copy()
+        return _s_curve(sensitivity)
+    return _X.copy()
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_curve(curve_type: str, sens_tenths: int) -> np.ndarray:
+    """Curve over _X, keyed on the slider's integer value (sensitivity * 10).
+
+    The slider only has 41 positions, so every curve it can produce fits in the cache.
+    """
+    y = _compute_curve(curve_type, sens_tenths / 10.0)
+    y.flags.writeable = False
+    return y
 
 
 class _PedalControls:
@@ -75,6 +120,10 @@ class _PedalControls:
     def sensitivity(self) -> float:
         return self.sens_slider.value() / 10.0
 
+    @property
+    def sens_tenths(self) -> int:
+        return self.sens_slider.value()
+
     def get_settings(self) -> dict:
         return {
             "curve_type": self.curve_type,
@@ -101,6 +150,11 @@ class PedalCalibration(QWidget):
         super().__init__(parent)
         self._pedals: dict[str, _PedalControls] = {}
         self._curves: dict[str, pg.PlotDataItem] = {}
+        # Slider drags emit valueChanged per pixel; replot at most once per ~60Hz frame
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(REDRAW_INTERVAL_MS)
+        self._redraw_timer.timeout.connect(self._update_curves)
         self._setup_ui()
         self._update_curves()
 
@@ -119,8 +173,7 @@ class PedalCalibration(QWidget):
         self._plot.addLegend()
 
         # Reference line (linear, dashed gray)
-        x_ref = np.linspace(0, 1, 100)
-        self._plot.plot(x_ref, x_ref, pen=pg.mkPen("gray", width=1, style=Qt.DashLine))
+        self._plot.plot(_X_REF, _X_REF, pen=pg.mkPen("gray", width=1, style=Qt.DashLine))
 
         # Create a curve line per pedal
         for pedal_info in PEDALS:
@@ -135,7 +188,7 @@ class PedalCalibration(QWidget):
         # --- Per-pedal controls ---
         for pedal_info in PEDALS:
             name = pedal_info["name"]
-            pc = _PedalControls(pedal_info, self._update_curves)
+            pc = _PedalControls(pedal_info, self._schedule_update)
             self._pedals[name] = pc
 
             group = QGroupBox(f"{name}  ({pedal_info['color']})")
@@ -168,11 +221,17 @@ class PedalCalibration(QWidget):
         cl.addStretch()
         layout.addWidget(cal_group)
 
+    def _schedule_update(self):
+        """Coalesce a burst of control changes into one deferred redraw."""
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+
     def _update_curves(self):
-        x = np.linspace(0, 1, 200)
+        self._redraw_timer.stop()  # Drop any redraw still pending from the same changes
         for name, pc in self._pedals.items():
-            y = _compute_curve(x, pc.curve_type, pc.sensitivity)
-            self._curves[name].setData(x, y)
+            y = _cached_curve(pc.curve_type, pc.sens_tenths)
+            # Curves are finite by construction, so skip pyqtgraph's isfinite scan
+            self._curves[name].setData(_X, y, skipFiniteCheck=True)
 
     def get_settings(self) -> dict:
         return {name: pc.get_settings() for name, pc in self._pedals.items()}
@@ -6,14 +6,40 @@ from PySide6.QtWidgets import (
     QPushButton, QListWidget, QFileDialog, QInputDialog, QMessageBox,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PROFILES_DIR = os.path.join(os.path.expanduser("~"), ".ffb_companion", "profiles")
 
 
+def _profile_path(name: str) -> str:
+    return os.path.join(PROFILES_DIR, f"{name}.json")
+
+
+def _read_json(path: str) -> dict:
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _write_json(path: str, settings: dict):
+    # Serialize before opening so a failure can't leave a truncated file behind
+    if orjson is not None:
+        data = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(settings, indent=2).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+
+
 class ProfileManager(QWidget):
     def __init__(self, main_window, parent=None):
         super().__init__(parent)
         self._main_window = main_window
         os.makedirs(PROFILES_DIR, exist_ok=True)
+        self._dir_mtime_ns: int | None = None  # PROFILES_DIR mtime at the last list rebuild
         self._setup_ui()
         self._refresh_list()
 
@@ -53,12 +79,34 @@ class ProfileManager(QWidget):
 
         layout.addStretch()
 
-    def _refresh_list(self):
+    def _refresh_list(self, force: bool = False):
+        """Rebuild the profile list, skipped when the directory is unchanged.
+
+        Our own save/delete/import pass force=True, since coarse filesystem
+        mtimes can miss a change made right after the last refresh.
+        """
+        try:
+            mtime_ns = os.stat(PROFILES_DIR).st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        if not force and mtime_ns is not None and mtime_ns == self._dir_mtime_ns:
+            return
+        self._dir_mtime_ns = mtime_ns
+
+        names = []
+        if mtime_ns is not None:
+            with os.scandir(PROFILES_DIR) as it:
+                names = [
+                    entry.name[:-5] for entry in it
+                    if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+                ]
         self._list.clear()
-        if os.path.isdir(PROFILES_DIR):
-            for f in sorted(os.listdir(PROFILES_DIR)):
-                if f.endswith(".json"):
-                    self._list.addItem(f[:-5])
+        self._list.addItems(sorted(names))
+
+    def showEvent(self, event):
+        # Pick up profiles added outside the app; cheap no-op when nothing changed
+        self._refresh_list()
+        super().showEvent(event)
 
     def _save_profile(self):
         name, ok = QInputDialog.getText(self, "Save Profile", "Profile name:")
@@ -66,18 +114,14 @@ class ProfileManager(QWidget):
             return
         name = name.strip()
         settings = self._main_window.get_all_settings()
-        path = os.path.join(PROFILES_DIR, f"{name}.json")
-        with open(path, "w") as f:
-            json.dump(settings, f, indent=2)
-        self._refresh_list()
+        _write_json(_profile_path(name), settings)
+        self._refresh_list(force=True)
 
     def _load_profile(self):
         item = self._list.currentItem()
         if not item:
             return
-        path = os.path.join(PROFILES_DIR, f"{item.text()}.json")
-        with open(path) as f:
-            settings = json.load(f)
+        settings = _read_json(_profile_path(item.text()))
         self._main_window.apply_all_settings(settings)
 
     def _delete_profile(self):
@@ -90,25 +134,21 @@ class ProfileManager(QWidget):
             QMessageBox.Yes | QMessageBox.No,
         )
         if reply == QMessageBox.Yes:
-            path = os.path.join(PROFILES_DIR, f"{item.text()}.json")
-            os.remove(path)
-            self._refresh_list()
+            os.remove(_profile_path(item.text()))
+            self._refresh_list(force=True)
 
     def _export_profile(self):
         item = self._list.currentItem()
         if not item:
             settings = self._main_window.get_all_settings()
         else:
-            path = os.path.join(PROFILES_DIR, f"{item.text()}.json")
-            with open(path) as f:
-                settings = json.load(f)
+            settings = _read_json(_profile_path(item.text()))
 
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Export Profile", "", "JSON Files (*.json)"
         )
         if file_path:
-            with open(file_path, "w") as f:
-                json.dump(settings, f, indent=2)
+            _write_json(file_path, settings)
 
     def _import_profile(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -116,10 +156,7 @@ class ProfileManager(QWidget):
         )
         if not file_path:
             return
-        with open(file_path) as f:
-            settings = json.load(f)
+        settings = _read_json(file_path)
         name = os.path.splitext(os.path.basename(file_path))[0]
-        dest = os.path.join(PROFILES_DIR, f"{name}.json")
-        with open(dest, "w") as f:
-            json.dump(settings, f, indent=2)
-        self._refresh_list()
+        _write_json(_profile_path(name), settings)
+        self._refresh_list(force=True)
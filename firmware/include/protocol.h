@@ -13,7 +13,7 @@
 #define CMD_SET_ENABLE    0x03  // uint8_t enable (0=disable, 1=enable)
 
 // Commands: ESP32 → PC
-#define CMD_TELEMETRY     0x10  // int16_t angle + uint16_t loop_rate_hz
+#define CMD_TELEMETRY     0x10  // int16_t angle + uint16_t loop_rate_hz + uint32_t sample_time_us
 #define CMD_FAULT         0x11  // uint8_t fault_code
 
 // Commands: Bidirectional
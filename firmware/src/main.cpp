@@ -7,6 +7,7 @@ static bool     servo_enabled = false;
 static int16_t  commanded_pos = 0;    // -32768 to 32767 from PC
 static uint8_t  gain = DEFAULT_GAIN;
 static int16_t  servo_angle_adc = 0;  // Raw ADC reading from angle wire
+static uint32_t servo_angle_time_us = 0;  // micros() when servo_angle_adc was sampled
 static uint16_t loop_rate_hz = 0;
 static uint8_t  fault_code = FAULT_NONE;
 
@@ -136,12 +137,16 @@ static void sendPacket(uint8_t cmd, const uint8_t *payload, uint8_t len) {
 }
 
 static void sendTelemetry() {
-    uint8_t payload[4];
+    uint8_t payload[8];
     payload[0] = servo_angle_adc & 0xFF;
     payload[1] = (servo_angle_adc >> 8) & 0xFF;
     payload[2] = loop_rate_hz & 0xFF;
     payload[3] = (loop_rate_hz >> 8) & 0xFF;
-    sendPacket(CMD_TELEMETRY, payload, 4);
+    payload[4] = servo_angle_time_us & 0xFF;
+    payload[5] = (servo_angle_time_us >> 8) & 0xFF;
+    payload[6] = (servo_angle_time_us >> 16) & 0xFF;
+    payload[7] = (servo_angle_time_us >> 24) & 0xFF;
+    sendPacket(CMD_TELEMETRY, payload, 8);
 }
 
 static void sendFault(uint8_t code) {
@@ -184,6 +189,7 @@ void loop() {
 
     // --- Read angle feedback ---
     servo_angle_adc = analogRead(SERVO_ADC_PIN);
+    servo_angle_time_us = micros();
 
     // --- Drive servo ---
     if (servo_enabled) {